@@ -5,6 +5,20 @@ import fs from 'fs'
 import {ImportError, Dependency} from './dependencies'
 import _ from 'lodash'
 import assert from 'assert'
+import {findFile} from './util'
+
+function mtimeOf(filename) {
+    try {
+        return fs.statSync(filename).mtime.getTime()
+    } catch (error) {
+        return 0
+    }
+}
+
+const tool_mtime = fs.statSync(__filename).mtime.getTime()
+
+const babelrc_filename = findFile('.babelrc')
+const babelrc_mtime = babelrc_filename ? mtimeOf(babelrc_filename) : 0
 
 export class BaseFile {
     dependencies = {}
@@ -18,12 +32,14 @@ export class BaseFile {
         this.usePolyfills = usePolyfills !== undefined ? usePolyfills : bundle.usePolyfills
         this.options = options
 
-        const rel_filename = path.relative(bundle.src_dirname, filename)
+        this.bundle_src_dirname = path.resolve(bundle.src_dirname)
+
+        const rel_filename = path.relative(this.bundle_src_dirname, filename)
 
         this.src_filename = path.resolve(filename)
         this.src_dirname = path.dirname(this.src_filename)
 
-        if (!this.src_filename.startsWith(path.resolve(bundle.src_dirname)))
+        if (!this.src_filename.startsWith(this.bundle_src_dirname))
             throw new Error(`File must be inside the bundle: ${this.src_filename} (inside ${bundle.src_dirname})`)
 
         this.out_filename = out_filename ? path.resolve(out_filename)
@@ -32,10 +48,12 @@ export class BaseFile {
         this.out_dirname = this.out_filename ? path.dirname(this.out_filename) : null
 
         if (this.out_filename && this.rootBundle.out_dirname) {
-            assert.ok(this.out_filename.startsWith(path.resolve(this.rootBundle.out_dirname)),
+            const root_out_dirname = path.resolve(this.rootBundle.out_dirname)
+
+            assert.ok(this.out_filename.startsWith(root_out_dirname),
                       'out_filename should be inside the bundle\'s out_dirname')
 
-            this.filename = path.relative(this.rootBundle.out_dirname, this.out_filename)
+            this.filename = path.relative(root_out_dirname, this.out_filename)
         } else {
             this.filename = rel_filename
         }
@@ -72,7 +90,7 @@ export class BaseFile {
     resolve(localFilename) {
         const filename = path.resolve(this.src_dirname, localFilename)
 
-        if (!(filename.startsWith(path.resolve(this.bundle.src_dirname))))
+        if (!(filename.startsWith(this.bundle_src_dirname)))
             throw new Error(`Resolved filename is outside of the bundle: ${localFilename} (resolved to ${filename})`)
 
         return filename
@@ -91,10 +109,86 @@ export class BaseFile {
         }
     }
 
+    upToDate(cache) {
+        if (!this.out_filename)
+            return false
+
+        let out_mtime = null
+
+        try {
+            out_mtime = fs.statSync(this.out_filename).mtime.getTime()
+
+            if (out_mtime < fs.statSync(this.src_filename).mtime.getTime())
+                return false
+        } catch (error) {
+            return false
+        }
+
+        // The transform also depends on qmlify itself, the Babel options and
+        // the bundle config (exports and polyfill gating)
+        if (out_mtime < tool_mtime || out_mtime < babelrc_mtime)
+            return false
+
+        if (out_mtime < mtimeOf(path.resolve(this.rootBundle.src_dirname, 'quickly.json')))
+            return false
+
+        // The output embeds the globals of every (transitive) dependency, so
+        // any changed dependency source makes it stale
+        const stack = [cache]
+        const visited = new Set([this.filename])
+
+        while (stack.length > 0) {
+            const current = stack.pop()
+
+            for (const dependency of Object.values(current['dependencies'] || {})) {
+                if (!dependency['filename'] || visited.has(dependency['filename']))
+                    continue
+
+                visited.add(dependency['filename'])
+
+                const dependencyCache = this.rootBundle.cache[dependency['filename']]
+
+                if (!dependencyCache || !dependencyCache['src_filename'])
+                    return false
+
+                try {
+                    if (out_mtime < fs.statSync(dependencyCache['src_filename']).mtime.getTime())
+                        return false
+                } catch (error) {
+                    return false
+                }
+
+                stack.push(dependencyCache)
+            }
+        }
+
+        return true
+    }
+
     build() {
         if (this.isBuilt)
             return
 
+        const cache = this.rootBundle.cache[this.filename]
+
+        if (cache && this.upToDate(cache)) {
+            this.loadFromCache(cache)
+            this.fromCache = true
+            this.isBuilt = true
+
+            // The skipped transform would have required these files into the
+            // bundle; re-register them so Bundle.save still sees the full
+            // resource list
+            for (const dependency of Object.values(this.dependencies)) {
+                if (!dependency.filename)
+                    continue
+
+                this.rootBundle.getFile(dependency.filename, { fromCache: true }).build()
+            }
+
+            return
+        }
+
         this.text = this.sourceText = fs.readFileSync(this.src_filename, 'utf8').trim() + '\n'
 
         try {
@@ -115,6 +209,9 @@ export class BaseFile {
     }
 
     save() {
+        if (this.fromCache)
+            return
+
         mkdirs(this.out_dirname)
         fs.writeFileSync(this.out_filename, this.text)
     }
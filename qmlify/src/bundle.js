@@ -2,7 +2,7 @@ import ExtendableError from 'es6-error'
 import fs from 'fs'
 import path from 'path'
 import assert from 'assert'
-import {isDir, getConfigFile} from './util'
+import {isDir, getConfigFile, tryReadFile} from './util'
 import {ImportError, require} from './dependencies'
 import {NOT_FOUND, JSON_INDENT_LEVEL} from './util'
 import * as qmldir from './qmldir'
@@ -11,6 +11,8 @@ export let babelConfig = null
 
 const fileTypes = []
 
+const dependencyResource = /dependencies\/(.*)\.js/
+
 const babelFile = getConfigFile('.babelrc')
 
 if (babelFile)
@@ -18,6 +20,7 @@ if (babelFile)
 
 export class Bundle {
     files = {}
+    files_by_src = {}
     config = {}
     cache = {}
 
@@ -81,17 +84,16 @@ export class Bundle {
     load() {
         this.qmldir = qmldir.load(this.src_dirname)
 
-        const quicklyFilename = this.resolve('quickly.json')
+        const quicklyFile = tryReadFile(this.resolve('quickly.json'))
 
-        if (fs.existsSync(quicklyFilename))
-            this.config = JSON.parse(fs.readFileSync(quicklyFilename, 'utf-8'))
+        if (quicklyFile)
+            this.config = JSON.parse(quicklyFile)
 
         if (this.out_dirname) {
-            const cacheFilename = path.resolve(this.out_dirname, '.qmlifycache')
+            const cacheFile = tryReadFile(path.resolve(this.out_dirname, '.qmlifycache'))
 
-            if (fs.existsSync(cacheFilename)) {
-                this.cache = JSON.parse(fs.readFileSync(cacheFilename, 'utf-8'))
-            }
+            if (cacheFile)
+                this.cache = JSON.parse(cacheFile)
         }
     }
 
@@ -106,7 +108,7 @@ export class Bundle {
     resolve(localFilename) {
         const filename = path.resolve(this.src_dirname, localFilename)
 
-        if (!filename.startsWith(path.resolve(this.src_dirname)))
+        if (!filename.startsWith(this.src_dirname))
             throw new Error(`Resolved filename is outside of the bundle: ${localFilename} (resolved to ${filename})`)
 
         return filename
@@ -125,7 +127,7 @@ export class Bundle {
             let file = this.files[resource.filename]
 
             if (!file) {
-                const match = resource.filename.match(/dependencies\/(.*)\.js/)
+                const match = resource.filename.match(dependencyResource)
                 if (match) {
                     try {
                         const filename = match[1]
@@ -149,12 +151,13 @@ export class Bundle {
     build_dir(dirname) {
         assert.ok(dirname)
 
+        const out_dirname = this.out_dirname ? path.resolve(this.out_dirname) : null
         const files = fs.readdirSync(dirname)
 
         for (const file of files) {
             const filename = path.resolve(dirname, file)
 
-            if (filename === path.resolve('', this.out_dirname) || filename.endsWith('node_modules')) {
+            if (filename === out_dirname || filename.endsWith('node_modules')) {
                 continue
             } else if (isDir(filename)) {
                 this.build_dir(filename)
@@ -175,6 +178,11 @@ export class Bundle {
         if (filename in this.files)
             return this.files[filename]
 
+        const src_filename = path.resolve(this.src_dirname, filename)
+
+        if (src_filename in this.files_by_src)
+            return this.files_by_src[src_filename]
+
         for (const [regex, fileType] of fileTypes) {
             if (filename.search(regex) !== NOT_FOUND) {
                 let file = null
@@ -208,9 +216,11 @@ export class Bundle {
                     throw new ImportError(`File doesn't exist: ${filename} (resolved to ${file.src_filename})`)
 
                 this.files[file.filename] = file
+                this.files_by_src[file.src_filename] = file
 
                 if (this.parentBundle) {
                     this.parentBundle.files[file.filename] = file
+                    this.parentBundle.files_by_src[file.src_filename] = file
                 }
 
                 return file
@@ -240,7 +250,7 @@ export class Bundle {
                              JSON.stringify(bundleInfo, null, JSON_INDENT_LEVEL))
 
         fs.writeFileSync(path.resolve(this.out_dirname, '.qmlifycache'),
-                         JSON.stringify(this.cache, null, JSON_INDENT_LEVEL))
+                         JSON.stringify(this.cache))
 
         const resources = this.resources.map(resource => `\t<file>${resource}</file>`).join('\n')
         const prefix = bundleInfo ? `/${bundleInfo.name}` : '/'
@@ -285,12 +295,13 @@ export class Bundle {
             deps.push(this.resolve('quickly.json'))
 
         if (fs.existsSync(source) && isDir(source)) {
+            const out_dirname = this.out_dirname ? path.resolve(this.out_dirname) : null
             const files = fs.readdirSync(source)
 
             for (const file of files) {
                 const filename = path.resolve(source, file)
 
-                if (this.out_dirname && filename === path.resolve('', this.out_dirname))
+                if (out_dirname && filename === out_dirname)
                     continue
 
                 deps = deps.concat(this.dependencies(filename))
@@ -16,24 +16,33 @@ export function requireHook(hook) {
 }
 
 export function checkDependency(name, target, chain) {
-    if (!dependencyMap[name])
-        return
+    const stack = [[name, chain || [target, name]]]
+    const visited = new Set()
 
-    const dependencies = dependencyMap[name]
+    while (stack.length > 0) {
+        const [current, currentChain] = stack.pop()
 
-    if (!chain)
-        chain = [target, name]
+        if (visited.has(current))
+            continue
 
-    for (const dep of dependencies) {
-        const newChain = chain.concat([dep])
+        visited.add(current)
 
-        if (dep === name)
-            throw new Error(`Module cannot depend on itself: ${dep}`)
+        const dependencies = dependencyMap[current]
 
-        if (dep === target)
-            throw new DependencyCycleError(`Dependency cycle: ${newChain.join(' - ')}`)
-        else
-            checkDependency(dep, target, newChain)
+        if (!dependencies)
+            continue
+
+        for (const dep of dependencies) {
+            const newChain = currentChain.concat([dep])
+
+            if (dep === current)
+                throw new Error(`Module cannot depend on itself: ${dep}`)
+
+            if (dep === target)
+                throw new DependencyCycleError(`Dependency cycle: ${newChain.join(' - ')}`)
+            else
+                stack.push([dep, newChain])
+        }
     }
 }
 
@@ -43,9 +52,13 @@ export function addDependency(source, dependency) {
 
     if (!dependencyMap[source])
         dependencyMap[source] = []
-    dependencyMap[source].push(dependency)
+
+    if (dependencyMap[source].includes(dependency))
+        return
 
     checkDependency(dependency, source)
+
+    dependencyMap[source].push(dependency)
 }
 
 export function require(importPath, context) {
@@ -91,18 +104,27 @@ function requireLocalFile(importPath, context) {
         importPath += '.js'
 
     const filename = path.normalize(importPath)
+    const resolved_filename = context.resolve(filename)
 
-    if (fs.existsSync(context.resolve(filename))) {
-        const file = context.bundle.build(context.resolve(filename))
+    if (fs.existsSync(resolved_filename)) {
+        const file = context.bundle.build(resolved_filename)
 
         return new Dependency(`"${importPath}.js"`, importPath, file)
-    } else if (context.bundle.parentBundle && fs.existsSync(context.bundle.parentBundle.resolve(filename))) {
-        const file = context.bundle.parentBundle.build(context.bundle.parentBundle.resolve(filename))
+    }
+
+    const parentBundle = context.bundle.parentBundle
 
-        return new Dependency(`"${context.relative(file.out_filename)}"`, importPath, file)
-    } else {
-        throw new ImportError(`Unable to find local file: ${filename} (resolved to ${context.resolve(filename)})`)
+    if (parentBundle) {
+        const parent_filename = parentBundle.resolve(filename)
+
+        if (fs.existsSync(parent_filename)) {
+            const file = parentBundle.build(parent_filename)
+
+            return new Dependency(`"${context.relative(file.out_filename)}"`, importPath, file)
+        }
     }
+
+    throw new ImportError(`Unable to find local file: ${filename} (resolved to ${resolved_filename})`)
 }
 
 export class Dependency {
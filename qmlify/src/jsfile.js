@@ -3,11 +3,19 @@ import {babelConfig} from './bundle'
 import * as templates from './templates'
 import * as babel from 'babel-core'
 
+const extraNewlines = /\n{3,}/g
+// Object property/method shorthand ({a, b} / {f() {}}) has no marker that
+// doesn't also match plain ES5 object literals, so it still slips through
+const es6Syntax = /\b(?:import|export|class|const|let|async|await|yield|of)\b|=>|`|\.\.\.|\*\*|\bvar\s*[[{]|function\s*\*|[,(]\s*[\w$]+\s*=[^=]/
+
+const babelOptions = Object.assign({ast: false}, babelConfig)
+
 export class JSFile extends BaseFile {
     header = templates.header
     postHeader = templates.postHeader
     footer = ''
     globals = []
+    exportedNames = []
 
     loadFromCache(cache) {
         super.loadFromCache(cache)
@@ -47,8 +55,8 @@ export class JSFile extends BaseFile {
     }
 
     transform() {
-        if (this.useBabel) {
-            this.text = babel.transform(this.text, babelConfig).code
+        if (this.useBabel && es6Syntax.test(this.text)) {
+            this.text = babel.transform(this.text, babelOptions).code
         }
 
         this.postHeader = this.postHeader.replace('FILENAME', this.basename)
@@ -84,21 +92,20 @@ export class JSFile extends BaseFile {
     }
 
     transformRequires() {
-        this.text = this.text.replace(templates.requireAs, (...args) => {
-            return this.replaceRequire(...args)
+        this.text = this.text.replace(templates.requireAs, (match, importAs, importPath) => {
+            return this.replaceRequire(match, importAs, importPath)
         })
 
-        this.text = this.text.replace(templates.requireSideEffects, (match, $1, ...args) => {
-            this.replaceRequire(match, $1, null, ...args)
+        this.text = this.text.replace(templates.requireSideEffects, (match, importPath) => {
+            this.replaceRequire(match, importPath, null)
             return ''
         })
 
-        this.text = this.text.replace(templates.require, (match, $1, ...args) => {
-            return this.replaceRequire(match, $1, null, ...args)
+        this.text = this.text.replace(templates.require, (match, importPath) => {
+            return this.replaceRequire(match, importPath, null)
         })
 
-        while (this.text.includes('\n\n\n'))
-            this.text = this.text.replace('\n\n\n', '\n\n')
+        this.text = this.text.replace(extraNewlines, '\n\n')
     }
 
     transformExports() {
@@ -107,51 +114,41 @@ export class JSFile extends BaseFile {
     }
 
     findGlobals() {
-        const regex = /global\.([\w\d_]+)\s+=/g
+        const regex = templates.definitions
+        regex.lastIndex = 0
         let match = null
 
         this.globals = []
+        this.exportedNames = []
 
         while ((match = regex.exec(this.text)) !== null) {
-            const name = match[1]
+            const names = match[1] === 'global' ? this.globals : this.exportedNames
+            const name = match[2]
 
-            if (!this.globals.includes(name))
-                this.globals.push(name)
+            if (!names.includes(name))
+                names.push(name)
         }
     }
 
     exposeExports() {
-        const regex = /exports\.([\w\d_]+)\s+=/g
-        let match = null
-
-        const exports = []
-
-        while ((match = regex.exec(this.text)) !== null) {
-            const name = match[1]
-
-            if (!exports.includes(name))
-                exports.push(name)
-        }
-
-        for (const name of exports) {
-            this.footer += `var ${name} = exports.${name};\n`
-        }
+        this.footer += this.exportedNames.map(name => `var ${name} = exports.${name};\n`).join('')
     }
 
     exportGlobals() {
-        for (const name of this.globals) {
-            this.footer += `var ${name} = global.${name};\n`
-        }
+        this.footer += this.globals.map(name => `var ${name} = global.${name};\n`).join('')
     }
 
     importGlobals() {
-        this.postHeader += '\n'
+        const importedGlobals = this.importedGlobals
+        const lines = ['\n']
 
-        for (const name of Object.keys(this.importedGlobals)) {
-            const qualifier = this.importedGlobals[name]
+        for (const name of Object.keys(importedGlobals)) {
+            const qualifier = importedGlobals[name]
 
-            this.postHeader += `var ${name} = global.${name} = ${qualifier}.global.${name};\n`
+            lines.push(`var ${name} = global.${name} = ${qualifier}.global.${name};\n`)
         }
+
+        this.postHeader += lines.join('')
     }
 
     injectRequire(importPath) {
@@ -2,11 +2,13 @@ import fs from 'fs'
 import path from 'path'
 import {applyPatch} from 'diff'
 
+const patches_dirname = path.resolve(__dirname, '../patches')
+
 export function patch(file, filename) {
     if (file.patched)
         return
 
-    const patch_filename = path.resolve(__dirname, '../patches', filename)
+    const patch_filename = path.resolve(patches_dirname, filename)
 
     if (!fs.existsSync(patch_filename))
         return
@@ -1,6 +1,9 @@
 import fs from 'fs'
 import path from 'path'
 
+const moduleLine = /module (.*)/
+const resourceLine = /(.*) (\d.\d) (.*\.js)/
+
 export function load(dirname) {
     const filename = path.resolve(dirname, 'qmldir')
 
@@ -17,9 +20,9 @@ export function load(dirname) {
     for (const line of text.split('\n')) {
         let match = null
 
-        if ((match = line.match(/module (.*)/)) !== null) {
+        if ((match = line.match(moduleLine)) !== null) {
             qmldir.moduleName = match[1]
-        } else if ((match = line.match(/(.*) (\d.\d) (.*\.js)/)) !== null) {
+        } else if ((match = line.match(resourceLine)) !== null) {
             qmldir.resources[match[1]] = {
                 latestVersion: match[2],
                 filename: match[3]
@@ -3,8 +3,9 @@ import {Bundle} from './bundle'
 import path from 'path'
 import fs from 'fs'
 import glob from 'glob'
+import os from 'os'
 import shell from 'shelljs'
-import {findFile} from './util'
+import {findFile, isDir} from './util'
 
 const modules = {}
 const moduleAliases = {}
@@ -16,6 +17,7 @@ export function requireModule(importPath, context) {
     let moduleName = null
     let version = null
     let typeName = null
+    let globals = null
 
     const bundle = (context instanceof Bundle) ? context
                                                : context.bundle.parentBundle || context.bundle
@@ -26,7 +28,7 @@ export function requireModule(importPath, context) {
     if (importPath.includes(' ')) {
         [moduleName, version, typeName] = parseImport(importPath)
     } else if (moduleAliases[importPath]) {
-        ({moduleName, version, typeName} = moduleAliases[importPath])
+        ({moduleName, version, typeName, globals} = moduleAliases[importPath])
 
         if (bundle.config.dependencies && bundle.config.dependencies[importPath]) {
             version = bundle.config.dependencies[importPath]
@@ -37,20 +39,28 @@ export function requireModule(importPath, context) {
         return null
     }
 
-    const module = modules[moduleName]
-
     const dependency = new Dependency(`${moduleName} ${version}`, moduleName.toLowerCase())
 
     dependency.typeName = typeName
-    dependency.globals = module ? typeName ? module.resources[typeName] ? module.resources[typeName].globals : []
-                                           : module.globals
-                                : []
+    dependency.globals = globals ? globals : moduleGlobals(moduleName, typeName)
 
     // console.log(`Resolved '${importPath}' as QML import ${moduleName} ${version} [${dependency.globals}]`)
 
     return dependency
 }
 
+function moduleGlobals(moduleName, typeName) {
+    const module = modules[moduleName]
+
+    if (!module)
+        return []
+
+    if (typeName)
+        return module.resources[typeName] ? module.resources[typeName].globals : []
+
+    return module.globals
+}
+
 function parseImport(importPath) {
     let moduleName = importPath
     let version = null
@@ -87,11 +97,42 @@ export function addImportPath(modulesDirname) {
             }
         }
     }
+
+    for (const alias of Object.values(moduleAliases)) {
+        alias.globals = moduleGlobals(alias.moduleName, alias.typeName)
+    }
 }
 
 requireHook(requireModule)
 
-addImportPath(shell.exec('qmake -query QT_INSTALL_QML', {silent:true}).stdout.trim())
+const qmake_cache_filename = path.join(os.homedir(), '.cache', 'qmlify', 'qmake-query')
+
+function findQtQmlPath() {
+    if (fs.existsSync(qmake_cache_filename)) {
+        const cached = fs.readFileSync(qmake_cache_filename, 'utf-8').trim()
+
+        if (cached && isDir(cached))
+            return cached
+    }
+
+    const qmlPath = shell.exec('qmake -query QT_INSTALL_QML', {silent:true}).stdout.trim()
+
+    if (qmlPath && isDir(qmlPath)) {
+        try {
+            shell.mkdir('-p', path.dirname(qmake_cache_filename))
+            fs.writeFileSync(qmake_cache_filename, qmlPath + '\n')
+        } catch (error) {
+            // An unwritable cache must never fail the build
+        }
+    }
+
+    return qmlPath
+}
+
+const qtQmlPath = findQtQmlPath()
+
+if (qtQmlPath)
+    addImportPath(qtQmlPath)
 
 const vendorPath = findFile('vendor')
 
@@ -17,3 +17,4 @@ export const requireSideEffects = /^require\(["']([^"']+)["']\);$/mg
 export const require = /require\(["']([^"']+)["']\)/mg
 export const exportImport = /Object\.defineProperty\(exports, \'(.+)\', \{\n\s*enumerable: true,\n\s*get: function get\(\) \{\n\s*return (.*)\.\1;\n\s*\}\n\s*\}\);/mg
 export const exportDefaultImport = /^exports\.(.*) = (.*)\.default;$/mg
+export const definitions = /(global|exports)\.([\w\d_]+)\s+=/g
@@ -4,8 +4,20 @@ import path from 'path'
 export const NOT_FOUND = -1
 export const JSON_INDENT_LEVEL = 2
 
+export function tryReadFile(filename) {
+    try {
+        return fs.readFileSync(filename, 'utf-8')
+    } catch (error) {
+        return null
+    }
+}
+
 export function isDir(filename) {
-    return fs.existsSync(filename) && fs.statSync(filename).isDirectory()
+    try {
+        return fs.statSync(filename).isDirectory()
+    } catch (error) {
+        return false
+    }
 }
 
 export function getConfigFile(filename, dirname) {
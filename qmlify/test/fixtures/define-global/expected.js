@@ -11,8 +11,6 @@ function require(qualifier) {
     return qualifier.module ? qualifier.module.exports : qualifier;
 }
 
-"use strict";
-
-global.PI = 3.1415;
+global.PI = 3.1415
 
 var PI = global.PI;
@@ -3,7 +3,9 @@ import {expect} from 'chai'
 
 import {Bundle} from '../../src/bundle'
 import {ImportError} from '../../src/dependencies'
+import fs from 'fs'
 import path from 'path'
+import shell from 'shelljs'
 
 describe('Bundle', function() {
     const base_dirname = path.resolve(__dirname, 'bundle')
@@ -311,4 +313,66 @@ describe('Bundle', function() {
             expect(this.bundle.files).to.include.keys(this.file.filename)
         })
     })
+
+    describe('rebuilding with a saved cache', function() {
+        before('build and save everything', function() {
+            const bundle = new Bundle(src_dirname, out_dirname, { usePolyfills: false })
+            bundle.build_all()
+            bundle.save()
+        })
+
+        after('remove the build output', function() {
+            // The saved cache must not leak into the other suites (or the
+            // next test run), which expect a pristine fixture tree
+            shell.rm('-rf', out_dirname)
+        })
+
+        context('when nothing changed', function() {
+            before('rebuild', function() {
+                this.bundle = new Bundle(src_dirname, out_dirname, { usePolyfills: false })
+                this.bundle.build_all()
+            })
+
+            it('should reuse the cached build', function() {
+                // eslint-disable-next-line
+                expect(this.bundle.files['uses-local.js'].fromCache).to.be.true
+            })
+
+            it('should restore the cached globals', function() {
+                expect(this.bundle.files['local-dep.js'].globals).to.have.members(['ANSWER'])
+            })
+
+            it('should re-register cached dependency files', function() {
+                const names = Object.keys(this.bundle.files)
+
+                // eslint-disable-next-line
+                expect(names.some(name => name.startsWith('dependencies/'))).to.be.true
+            })
+        })
+
+        context('when a dependency changed', function() {
+            before('touch the dependency and rebuild', function() {
+                const later = new Date(Date.now() + 10000)
+                fs.utimesSync(path.resolve(src_dirname, 'local-dep.js'), later, later)
+
+                this.bundle = new Bundle(src_dirname, out_dirname, { usePolyfills: false })
+                this.bundle.build_all()
+            })
+
+            after('restore the dependency mtime', function() {
+                const now = new Date()
+                fs.utimesSync(path.resolve(src_dirname, 'local-dep.js'), now, now)
+            })
+
+            it('should rebuild the dependency', function() {
+                // eslint-disable-next-line
+                expect(this.bundle.files['local-dep.js'].fromCache).to.not.be.true
+            })
+
+            it('should rebuild the file that imports it', function() {
+                // eslint-disable-next-line
+                expect(this.bundle.files['uses-local.js'].fromCache).to.not.be.true
+            })
+        })
+    })
 })
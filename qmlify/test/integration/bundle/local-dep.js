@@ -0,0 +1 @@
+global.ANSWER = 42
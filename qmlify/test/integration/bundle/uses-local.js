@@ -0,0 +1,4 @@
+/* global ANSWER */
+import './local-dep'
+
+console.log(ANSWER)